@@ -0,0 +1,66 @@
+"""
+bench_fuzzy.py
+==============
+Lookup latency benchmark for the typo-correction index in ``src/fuzzy.py``.
+
+Builds indexes over increasingly large synthetic vocabularies (plus the
+real station directions) and reports the mean time per ``resolve`` call
+for exact hits, single-edit typos, and misses.
+
+Run from the project root with:
+    python -m benchmarks.bench_fuzzy
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import time
+import timeit
+
+from src.fuzzy import build_direction_index, FuzzyIndex
+from src.world import ROOM_CONNECTIONS
+
+VOCABULARY_SIZES = (10, 1_000, 10_000, 100_000)
+QUERIES = {
+    "exact": "north",
+    "typo": "nroth",
+    "miss": "qzxv",
+}
+REPEATS = 5
+CALLS = 2_000
+
+
+def _synthetic_vocabulary(size: int, seed: int = 9) -> list[str]:
+    """Return ``size`` random lowercase words of length 4-10."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        for _ in range(size)
+    ]
+
+
+def _time_resolve(index: FuzzyIndex, query: str) -> float:
+    """Return the best mean time per call, in microseconds."""
+    timer = timeit.Timer(lambda: index.resolve(query))
+    return min(timer.repeat(repeat=REPEATS, number=CALLS)) / CALLS * 1e6
+
+
+def main() -> None:
+    """Print build time and per-lookup latency for each vocabulary size."""
+    base = build_direction_index(ROOM_CONNECTIONS)
+
+    print(f"{'vocab':>8} {'build ms':>9} " + " ".join(f"{name + ' us':>9}" for name in QUERIES))
+    for size in VOCABULARY_SIZES:
+        vocabulary = list(base.vocabulary) + _synthetic_vocabulary(size)
+
+        start = time.perf_counter()
+        index = FuzzyIndex(vocabulary)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        timings = " ".join(f"{_time_resolve(index, query):>9.2f}" for query in QUERIES.values())
+        print(f"{len(index):>8} {build_ms:>9.1f} {timings}")
+
+
+if __name__ == "__main__":
+    main()
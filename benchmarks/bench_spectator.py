@@ -0,0 +1,85 @@
+"""
+bench_spectator.py
+==================
+Broadcast cost benchmark for the spectator hub in ``src/spectator.py``.
+
+For each subscriber count, replays a short scripted session and reports:
+- publish cost per turn (encode once into the ring buffer)
+- fan-out cost per turn (every subscriber polls its frames)
+- fan-out cost per subscriber
+
+A naive baseline that encodes a fresh frame for every viewer is shown for
+comparison.
+
+Run from the project root with:
+    python -m benchmarks.bench_spectator
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from src.spectator import SpectatorHub
+
+SUBSCRIBER_COUNTS = (1, 10, 100, 1_000, 10_000, 100_000)
+
+SESSION = (
+    {"room": "Main Hall"},
+    {"room": "Security Office", "item": "override_alpha"},
+    {"room": "Main Hall"},
+    {"room": "Engineering Bay", "item": "override_beta"},
+    {"room": "Main Hall"},
+    {"room": "Observation Deck", "item": "override_gamma"},
+    {"outcome": "FAILURE"},
+)
+
+
+def _naive_turn(subscriber_count: int, delta: dict[str, str]) -> None:
+    """Encode the delta separately for every viewer."""
+    for _ in range(subscriber_count):
+        json.dumps(delta, separators=(",", ":")).encode("utf-8")
+
+
+def main() -> None:
+    """Print per-turn broadcast cost as the subscriber count grows."""
+    print(
+        f"{'subs':>8} {'publish us':>11} {'fan-out ms':>11} "
+        f"{'ns/sub':>8} {'naive ms':>9}"
+    )
+
+    for count in SUBSCRIBER_COUNTS:
+        hub = SpectatorHub()
+        subscriptions = [hub.subscribe() for _ in range(count)]
+        for subscription in subscriptions:
+            hub.poll(subscription)
+
+        publish_total = 0.0
+        fan_out_total = 0.0
+        naive_total = 0.0
+
+        for delta in SESSION:
+            start = time.perf_counter()
+            hub.publish(**delta)
+            publish_total += time.perf_counter() - start
+
+            start = time.perf_counter()
+            for subscription in subscriptions:
+                hub.poll(subscription)
+            fan_out_total += time.perf_counter() - start
+
+            start = time.perf_counter()
+            _naive_turn(count, delta)
+            naive_total += time.perf_counter() - start
+
+        turns = len(SESSION)
+        print(
+            f"{count:>8} {publish_total / turns * 1e6:>11.2f} "
+            f"{fan_out_total / turns * 1e3:>11.3f} "
+            f"{fan_out_total / turns / count * 1e9:>8.0f} "
+            f"{naive_total / turns * 1e3:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
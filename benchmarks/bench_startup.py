@@ -0,0 +1,102 @@
+"""
+bench_startup.py
+================
+Cold vs. warm start benchmark for *Echoes of Abyssus-9*.
+
+Reports the best of several runs for:
+- a bare interpreter, with and without ``site`` (the floor for any
+  per-connection process)
+- importing ``src.game`` eagerly (every subsystem loaded up front, as
+  before lazy loading)
+- importing ``src.game`` as shipped (lazy subsystems)
+- a full game session to the first command, with the default and the
+  recommended fast-start command lines
+- a warm start: connecting to the preforking launcher and receiving the
+  first byte of the intro
+
+Run from the project root with:
+    python -m benchmarks.bench_startup
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+RUNS = 15
+PORT = 4019
+WORKERS = 4
+
+FAST_START = "from src.game import main; main()"
+
+COLD_CASES = {
+    "bare interpreter": ["-c", "pass"],
+    "bare interpreter (-S)": ["-S", "-c", "pass"],
+    "import (eager)": ["-c", "import typing, src.game, src.fuzzy, src.spectator"],
+    "import (lazy)": ["-c", "import src.game"],
+    "first command (-m src.game)": ["-m", "src.game"],
+    "first command (-c)": ["-c", FAST_START],
+    "first command (fast start, -S)": ["-S", "-c", FAST_START],
+}
+
+
+def _cold_ms(arguments: list[str]) -> float:
+    """Return the fastest wall-clock time of a fresh process, in ms."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *arguments],
+            input=b"quit\n",
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
+
+
+def _warm_ms() -> float:
+    """Return the fastest connect-to-first-byte time via the launcher, in ms."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.launcher", "--port", str(PORT), "--workers", str(WORKERS)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", PORT)).close()
+                break
+            except ConnectionRefusedError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+        timings = []
+        for _ in range(RUNS):
+            time.sleep(0.05)  # Let the launcher replace the previous worker
+            start = time.perf_counter()
+            with socket.create_connection(("127.0.0.1", PORT)) as connection:
+                connection.recv(1)
+                timings.append(time.perf_counter() - start)
+                connection.sendall(b"quit\n")
+        return min(timings) * 1e3
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    """Print cold and warm start timings."""
+    for name, arguments in COLD_CASES.items():
+        print(f"{name:<30} {_cold_ms(arguments):>8.2f} ms")
+
+    if hasattr(os, "fork"):
+        print(f"{'warm (preforked launcher)':<30} {_warm_ms():>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,15 +18,49 @@ This module contains no gameplay loop or world data.
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Literal
 
+from . import events as _events
 from .player import Player
 
 # ---------------------------------------------------------------------------
 # Public API Types
 # ---------------------------------------------------------------------------
+# Type checkers see ``Outcome`` below. At runtime it is created on first
+# access (see ``__getattr__``) so importing this module does not pull in
+# ``typing`` at startup. Annotations refer to it as ``_events.Outcome`` so
+# that ``typing.get_type_hints`` goes through that lazy lookup instead of
+# failing on a name missing from the module globals.
+# ---------------------------------------------------------------------------
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Literal
+
+    Outcome = Literal["SUCCESS", "FAILURE"]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Resolve lazily defined module attributes (PEP 562).
+
+    Args:
+        name (str): Attribute being looked up.
+
+    Returns:
+        object: ``Outcome``, created and cached on first access.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily defined attribute.
+    """
+    if name == "Outcome":
+        from typing import Literal
+
+        outcome = Literal["SUCCESS", "FAILURE"]
+        globals()["Outcome"] = outcome
+        return outcome
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-Outcome = Literal["SUCCESS", "FAILURE"]
 
 # ---------------------------------------------------------------------------
 # Narrative Text Constants
@@ -100,7 +134,7 @@ def handle_final_event(
     player: Player,
     required_item_count: int | None = None,
     required_item_ids: Sequence[str] | None = None,
-) -> Outcome:
+) -> _events.Outcome:
     """
     Execute the final encounter inside the Control Center.
 
@@ -121,12 +155,18 @@ def handle_final_event(
             "Exactly one of 'required_item_count' or 'required_item_ids' must be provided."
         )
 
-    inventory = set(player.inventory)
+    inventory = player.inventory
 
     if required_item_ids is not None:
-        has_all_items = all(item_id in inventory for item_id in required_item_ids)
+        # Plain loop over the (small) inventory list avoids building a set
+        # and a generator on every final encounter.
+        has_all_items = True
+        for item_id in required_item_ids:
+            if item_id not in inventory:
+                has_all_items = False
+                break
     else:
-        has_all_items = len(inventory) >= required_item_count
+        has_all_items = len(set(inventory)) >= required_item_count
 
     if has_all_items:
         print(VICTORY_MESSAGE)
@@ -0,0 +1,268 @@
+"""
+fuzzy.py
+========
+Typo-tolerant command and direction resolution for *Echoes of Abyssus-9*.
+
+This module provides a precomputed deletion-neighborhood index (the
+"symmetric delete" technique) so that inputs such as ``"nroth"``, ``"est"``
+or ``"hlep"`` can be resolved to known words without scanning the whole
+vocabulary with an edit-distance routine on every command.
+
+Responsibilities:
+- Build a correction index from a fixed vocabulary
+- Resolve raw words to the closest vocabulary entry, optionally narrowed
+  to a per-room candidate set
+- Provide builders for the direction and command vocabularies
+
+This module contains no game loop logic or print statements.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Mapping
+
+__all__ = [
+    "FuzzyIndex",
+    "edit_distance",
+    "build_direction_index",
+    "build_command_index",
+]
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_MAX_DISTANCE = 1
+
+# Words shorter than this are only ever matched exactly: at one edit away,
+# "no", "to" and "so" would all become "go".
+MIN_CORRECTION_LENGTH = 3
+
+_NO_MATCHES: frozenset[str] = frozenset()
+
+
+# ---------------------------------------------------------------------------
+# Distance Helpers
+# ---------------------------------------------------------------------------
+
+def edit_distance(source: str, target: str) -> int:
+    """
+    Return the optimal string alignment distance between two words.
+
+    Counts insertions, deletions, substitutions, and transpositions of
+    adjacent characters, so ``"nroth"`` is a single edit away from ``"north"``.
+
+    Args:
+        source (str): First word.
+        target (str): Second word.
+
+    Returns:
+        int: Number of edits needed to turn ``source`` into ``target``.
+    """
+    if source == target:
+        return 0
+
+    target_length = len(target)
+    before_previous_row: list[int] = []
+    previous_row = list(range(target_length + 1))
+    previous_char = ""
+
+    for i, source_char in enumerate(source, start=1):
+        current_row = [i]
+        left = i
+        prior_target_char = ""
+
+        for j, target_char in enumerate(target, start=1):
+            best = previous_row[j - 1] + (source_char != target_char)
+            if previous_row[j] + 1 < best:
+                best = previous_row[j] + 1
+            if left + 1 < best:
+                best = left + 1
+            if (
+                source_char == prior_target_char
+                and previous_char == target_char
+                and before_previous_row[j - 2] + 1 < best
+            ):
+                best = before_previous_row[j - 2] + 1
+
+            current_row.append(best)
+            left = best
+            prior_target_char = target_char
+
+        before_previous_row, previous_row = previous_row, current_row
+        previous_char = source_char
+
+    return previous_row[target_length]
+
+
+def _deletions(word: str, max_distance: int) -> set[str]:
+    """
+    Return every string reachable from ``word`` by up to ``max_distance`` deletions.
+
+    The word itself is included.
+    """
+    results = {word}
+    frontier = {word}
+
+    for _ in range(max_distance):
+        next_frontier: set[str] = set()
+        for fragment in frontier:
+            for index in range(len(fragment)):
+                next_frontier.add(fragment[:index] + fragment[index + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Correction Index
+# ---------------------------------------------------------------------------
+
+class FuzzyIndex:
+    """
+    Precomputed deletion-neighborhood index over a fixed vocabulary.
+
+    Every vocabulary word is expanded into its deletion neighborhood once,
+    at build time, and filed under its own length. A lookup expands only the
+    query and consults only the buckets for lengths within ``max_distance``
+    of it, then verifies the surviving candidates with ``edit_distance``.
+
+    Lookup cost grows with the number of vocabulary words that share a
+    deletion fragment with the query, not with the full vocabulary size;
+    ``benchmarks/bench_fuzzy.py`` reports the measured scaling.
+    """
+
+    def __init__(self, vocabulary: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE):
+        """
+        Build the index for the given vocabulary.
+
+        Args:
+            vocabulary (Iterable[str]): Known words. Entries are lowercased.
+            max_distance (int): Largest edit distance accepted as a correction.
+
+        Raises:
+            ValueError: If ``max_distance`` is negative.
+        """
+        if max_distance < 0:
+            raise ValueError("'max_distance' must be zero or greater.")
+
+        self.max_distance: int = max_distance
+        self.vocabulary: frozenset[str] = frozenset(word.lower() for word in vocabulary)
+        # Word length -> deletion fragment -> words of that length
+        self._neighborhoods: dict[int, dict[str, set[str]]] = {}
+
+        for word in self.vocabulary:
+            bucket = self._neighborhoods.setdefault(len(word), {})
+            distance = max_distance if len(word) >= MIN_CORRECTION_LENGTH else 0
+            for fragment in _deletions(word, distance):
+                bucket.setdefault(fragment, set()).add(word)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.vocabulary
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    def resolve(self, word: str, candidates: Collection[str] | None = None) -> str | None:
+        """
+        Resolve a raw word to the closest known vocabulary entry.
+
+        Exact vocabulary matches are returned immediately, or rejected if
+        they are not among ``candidates``. Words shorter than
+        ``MIN_CORRECTION_LENGTH`` are never corrected, in either direction.
+        Otherwise the closest entry
+        within ``max_distance`` is returned; ties are broken in favour of
+        entries sharing the first letter. Genuinely ambiguous input returns
+        None rather than guessing.
+
+        Args:
+            word (str): Normalized (lowercase) user input.
+            candidates (Collection[str] | None): Optional subset of the
+                vocabulary to accept, such as the current room's exits.
+
+        Returns:
+            str | None: The resolved word, or None if nothing matches.
+        """
+        if word in self.vocabulary:
+            # Known words are never corrected into a different entry.
+            return word if candidates is None or word in candidates else None
+
+        if len(word) < MIN_CORRECTION_LENGTH:
+            return None
+
+        fragments = _deletions(word, self.max_distance)
+        length = len(word)
+
+        # Only words whose length is within max_distance can match.
+        matches: set[str] = set()
+        for bucket_length in range(length - self.max_distance, length + self.max_distance + 1):
+            bucket = self._neighborhoods.get(bucket_length)
+            if bucket is None:
+                continue
+            for fragment in fragments:
+                matches |= bucket.get(fragment, _NO_MATCHES)
+
+        best: list[str] = []
+        best_rank: tuple[int, int] | None = None
+
+        for match in matches:
+            if candidates is not None and match not in candidates:
+                continue
+
+            distance = edit_distance(word, match)
+            if distance > self.max_distance:
+                continue
+
+            rank = (distance, 0 if match[0] == word[0] else 1)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = [match], rank
+            elif rank == best_rank:
+                best.append(match)
+
+        return best[0] if len(best) == 1 else None
+
+
+# ---------------------------------------------------------------------------
+# Vocabulary Builders
+# ---------------------------------------------------------------------------
+
+def build_direction_index(
+    connections: Mapping[str, Mapping[str, str]],
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> FuzzyIndex:
+    """
+    Build a correction index over every exit direction in the world.
+
+    Should be called once per world load so custom layouts with extra
+    directions are picked up.
+
+    Args:
+        connections (Mapping[str, Mapping[str, str]]): Room graph, such as
+            ``world.ROOM_CONNECTIONS``.
+        max_distance (int): Largest edit distance accepted as a correction.
+
+    Returns:
+        FuzzyIndex: Index over all exit directions.
+    """
+    directions = {direction for exits in connections.values() for direction in exits}
+    return FuzzyIndex(directions, max_distance=max_distance)
+
+
+def build_command_index(
+    commands: Iterable[str],
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> FuzzyIndex:
+    """
+    Build a correction index over command words.
+
+    Args:
+        commands (Iterable[str]): Command words, such as ``"go"`` or ``"help"``.
+        max_distance (int): Largest edit distance accepted as a correction.
+
+    Returns:
+        FuzzyIndex: Index over the command words.
+    """
+    return FuzzyIndex(commands, max_distance=max_distance)
@@ -19,16 +19,28 @@ from __future__ import annotations
 from .events import handle_intro_event, handle_final_event
 from .player import Player
 from .utils import (
+    format_room,
     normalize_direction,
     print_move_failure,
     print_move_success,
-    print_room_description,
-    describe_exits,
 )
-from .world import get_room_description, get_exits
+from .world import ROOM_CONNECTIONS, get_room_description, get_exits
 from .items import ROOM_ITEMS
 
-__all__ = ["main"]
+# Annotation-only imports. Spelled without ``typing`` so startup does not
+# pay for importing it; ``fuzzy`` is loaded on the first command instead.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .fuzzy import FuzzyIndex
+    from .spectator import SpectatorHub
+
+__all__ = [
+    "main",
+    "handle_move",
+    "prepare",
+    "build_room_text",
+    "build_correction_indexes",
+]
 
 # ---------------------------------------------------------------------------
 # Progression Requirements
@@ -43,9 +55,14 @@ REQUIRED_ITEM_IDS = [item for item in ROOM_ITEMS.values() if item]
 FINAL_ROOM = "Control Center"
 
 QUIT_COMMAND = "quit"
-MOVE_PREFIX = "go "
+MOVE_COMMAND = "go"
 HELP_COMMAND = "help"
 
+# Commands eligible for typo correction. Quitting is destructive, so it
+# is never inferred from a typo and must be entered exactly. "go" is below
+# fuzzy.MIN_CORRECTION_LENGTH, so it is matched exactly as well.
+COMMAND_WORDS = (MOVE_COMMAND, HELP_COMMAND)
+
 HELP_TEXT = (
     "Commands:\n"
     "- 'go <direction>' to move\n"
@@ -53,46 +70,165 @@ HELP_TEXT = (
     "- 'quit' to exit"
 )
 
+# ---------------------------------------------------------------------------
+# World Tables
+# ---------------------------------------------------------------------------
+# Derived tables are rebuilt on every world load (each call to ``main``),
+# so runtime changes to the world data are always picked up.
+# ---------------------------------------------------------------------------
+
+def build_room_text() -> dict[str, str]:
+    """
+    Render the text shown for every room in the world.
+
+    Returns:
+        dict[str, str]: Room name -> text printed while the player is there.
+    """
+    return {
+        room: format_room(room, get_room_description(room), exits)
+        for room, exits in ROOM_CONNECTIONS.items()
+    }
+
+
+def build_correction_indexes() -> tuple[FuzzyIndex, FuzzyIndex]:
+    """
+    Build the (command, direction) typo-correction indexes.
+
+    Not needed until the first command, so ``fuzzy`` is imported here
+    rather than at module load.
+
+    Returns:
+        tuple[FuzzyIndex, FuzzyIndex]: Command index and direction index.
+    """
+    from .fuzzy import build_command_index, build_direction_index
+
+    return (
+        build_command_index(COMMAND_WORDS),
+        build_direction_index(ROOM_CONNECTIONS),
+    )
+
+
+def prepare() -> None:
+    """
+    Import every subsystem ``main`` loads lazily.
+
+    Used by the preforking launcher so that forked workers start with all
+    modules already imported. World tables are still built per game.
+    """
+    from importlib import import_module
+
+    import_module(".fuzzy", __package__)
+
+
+# ---------------------------------------------------------------------------
+# Turn Handling
+# ---------------------------------------------------------------------------
+
+def handle_move(
+    player: Player,
+    direction: str,
+    direction_index: FuzzyIndex,
+    spectators: SpectatorHub | None = None,
+) -> None:
+    """
+    Resolve and execute a single movement command.
+
+    Corrects typos against the current room's exits, moves the player,
+    auto-collects any item in the destination, and publishes the resulting
+    state delta to spectators.
+
+    This is the per-turn hot path; its memory use is checked by
+    tests/test_allocations.py.
+
+    Args:
+        player (Player): The active player.
+        direction (str): Normalized direction entered by the player.
+        direction_index (FuzzyIndex): Typo-correction index for directions.
+        spectators (SpectatorHub | None): Optional spectator hub.
+    """
+    corrected = direction_index.resolve(
+        direction, candidates=get_exits(player.current_room)
+    )
+    if corrected and corrected != direction:
+        print(f"(Interpreting '{direction}' as '{corrected}'.)")
+        direction = corrected
+
+    destination = player.move(direction)
+
+    if not destination:
+        print_move_failure(direction)
+        return
+
+    player.current_room = destination
+    print_move_success(direction, destination)
+
+    # Auto-collect items on room entry
+    item = player.collect_item()
+    if item:
+        print(f"You picked up: {item}")
+
+    if spectators is not None:
+        spectators.publish(room=destination, item=item)
+
+
 # ---------------------------------------------------------------------------
 # Main Game Loop
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+def main(spectators: SpectatorHub | None = None) -> None:
     """
     Entry point for the Echoes of Abyssus-9 adventure.
+
+    Args:
+        spectators (SpectatorHub | None): Optional hub that receives one
+            compact state delta per state-changing turn for live viewers,
+            and a final delta marking the end of the session.
     """
     player = Player(starting_room="Docking Bay")
 
+    if spectators is not None:
+        spectators.publish(room=player.current_room)
+
+    # Room text is rendered once per world load and reused every turn
+    room_text = build_room_text()
+    correction_indexes = None
+
     # Display opening narrative and instructions
     handle_intro_event()
 
     while player.current_room != FINAL_ROOM:
-        print(f"\nYou are in the {player.current_room}.")
-        print_room_description(get_room_description(player.current_room))
-        describe_exits(get_exits(player.current_room))
+        room = player.current_room
+        if room not in room_text:
+            room_text[room] = format_room(room, get_room_description(room), get_exits(room))
+        print(room_text[room])
 
         command = input("> ").strip().lower()
+        if correction_indexes is None:
+            correction_indexes = build_correction_indexes()
+        command_index, direction_index = correction_indexes
 
-        if command.startswith(MOVE_PREFIX):
-            direction = normalize_direction(command[len(MOVE_PREFIX):])
-            destination = player.move(direction)
-
-            if destination:
-                player.current_room = destination
-                print_move_success(direction, destination)
+        verb, _, argument = command.partition(" ")
+        corrected_verb = command_index.resolve(verb)
+        if corrected_verb and corrected_verb != verb:
+            print(f"(Interpreting '{verb}' as '{corrected_verb}'.)")
+            verb = corrected_verb
 
-                # Auto-collect items on room entry
-                item = player.collect_item()
-                if item:
-                    print(f"You picked up: {item}")
-            else:
-                print_move_failure(direction)
+        if verb == MOVE_COMMAND and argument.strip():
+            handle_move(
+                player,
+                normalize_direction(argument),
+                direction_index,
+                spectators,
+            )
 
-        elif command == QUIT_COMMAND:
+        elif verb == QUIT_COMMAND and not argument:
             print("\nMission aborted. Exiting Abyssus-9.")
+
+            if spectators is not None:
+                spectators.publish(ended=True)
             return
 
-        elif command == HELP_COMMAND:
+        elif verb == HELP_COMMAND and not argument:
             print(HELP_TEXT)
 
         else:
@@ -107,6 +243,9 @@ def main() -> None:
         required_item_ids=REQUIRED_ITEM_IDS,
     )
 
+    if spectators is not None:
+        spectators.publish(outcome=outcome, ended=True)
+
     print(
         "\n*** Mission Summary ***\n"
         f"Items Collected: {player.inventory}\n"
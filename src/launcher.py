@@ -0,0 +1,190 @@
+"""
+launcher.py
+===========
+Preforking network launcher for *Echoes of Abyssus-9*.
+
+Serves one game per TCP connection. The parent process imports the game
+and all of its subsystems once, then forks a pool of workers that wait
+on the shared listening socket. Each connection is therefore handled by a
+process that is already warm, instead of paying interpreter start-up and
+imports per connection.
+
+Each worker plays exactly one game and then exits, so per-game state
+(such as collected items) never leaks between connections. The parent
+replaces every worker that exits.
+
+Responsibilities:
+- Warm up the game before forking
+- Maintain a fixed-size pool of forked workers
+- Attach each connection to the game's input and output
+
+Run from the project root with:
+    python -m src.launcher [--host HOST] [--port PORT] [--workers N]
+
+Requires ``os.fork`` (POSIX only).
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import sys
+
+from . import game
+
+__all__ = ["serve", "play_connection"]
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 4009
+DEFAULT_WORKERS = 4
+
+
+# ---------------------------------------------------------------------------
+# Connection Handling
+# ---------------------------------------------------------------------------
+
+def play_connection(connection: socket.socket) -> None:
+    """
+    Play a single game over an accepted connection.
+
+    The game reads and writes through ``input`` and ``print``, so the
+    connection is attached to ``sys.stdin`` and ``sys.stdout`` for the
+    duration of the game.
+
+    Args:
+        connection (socket.socket): Accepted client connection.
+    """
+    reader = connection.makefile("r", encoding="utf-8", newline="\n")
+    writer = connection.makefile("w", encoding="utf-8", newline="\n", buffering=1)
+
+    stdin, stdout = sys.stdin, sys.stdout
+    sys.stdin, sys.stdout = reader, writer
+    try:
+        game.main()
+    except (EOFError, ConnectionError):
+        pass  # Client disconnected mid-game
+    finally:
+        sys.stdin, sys.stdout = stdin, stdout
+        try:
+            writer.close()
+        except OSError:
+            pass
+        reader.close()
+
+
+def _run_worker(listener: socket.socket) -> None:
+    """
+    Accept one connection, play one game, and exit the worker process.
+    """
+    status = 0
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        connection, _ = listener.accept()
+        listener.close()
+        with connection:
+            play_connection(connection)
+    except BaseException:
+        status = 1
+    finally:
+        os._exit(status)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def _handle_sigterm(signum, frame) -> None:
+    """Treat SIGTERM like Ctrl+C so the parent shuts its workers down."""
+    raise KeyboardInterrupt
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+) -> None:
+    """
+    Serve games over TCP using a pool of preforked, warm workers.
+
+    Runs until interrupted with Ctrl+C or SIGTERM.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+        workers (int): Number of workers waiting for connections at once.
+
+    Raises:
+        RuntimeError: If the platform does not support ``os.fork``.
+        ValueError: If ``workers`` is less than 1.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("The preforking launcher requires os.fork (POSIX only).")
+    if workers < 1:
+        raise ValueError("'workers' must be at least 1.")
+
+    # Import every subsystem once, before forking.
+    game.prepare()
+    sys.stdout.flush()
+
+    listener = socket.create_server((host, port), backlog=workers * 4)
+    children: set[int] = set()
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    try:
+        while True:
+            while len(children) < workers:
+                pid = os.fork()
+                if pid == 0:
+                    _run_worker(listener)
+                children.add(pid)
+
+            pid, _ = os.wait()
+            children.discard(pid)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        listener.close()
+
+
+# ---------------------------------------------------------------------------
+# Command-Line Entry Point
+# ---------------------------------------------------------------------------
+
+def _main(argv: list[str] | None = None) -> None:
+    """
+    Parse command-line arguments and start the launcher.
+
+    Args:
+        argv (list[str] | None): Arguments to parse; defaults to ``sys.argv``.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve Echoes of Abyssus-9 over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args(argv)
+
+    print(f"Serving Echoes of Abyssus-9 on {args.host}:{args.port} ({args.workers} workers)")
+    serve(args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    _main()
@@ -14,7 +14,7 @@ structure abstractly and leaves UI rendering to higher-level modules.
 
 from __future__ import annotations
 
-from collections.abc import Collection
+from collections.abc import Iterator, Sequence
 
 from .world import get_exits
 from .utils import normalize_direction
@@ -23,6 +23,36 @@ from .items import get_room_item, set_room_item
 __all__ = ["Player"]
 
 
+# ---------------------------------------------------------------------------
+# Inventory View
+# ---------------------------------------------------------------------------
+
+class _InventoryView(Sequence):
+    """
+    Read-only, non-copying view over a player's inventory list.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[str]):
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+
 # ---------------------------------------------------------------------------
 # Player Class
 # ---------------------------------------------------------------------------
@@ -48,6 +78,7 @@ class Player:
         """
         self.current_room: str = starting_room
         self.inventory: list[str] = []
+        self._inventory_view = _InventoryView(self.inventory)
 
     # ----------------------------------------------------------------------
     # Movement
@@ -94,10 +125,12 @@ class Player:
     # ----------------------------------------------------------------------
 
     @property
-    def inventory_view(self) -> Collection[str]:
+    def inventory_view(self) -> Sequence[str]:
         """
         Read-only view of the player's inventory.
 
-        Exposed as an immutable collection to discourage direct mutation.
+        Exposed as an immutable sequence to discourage direct mutation. The
+        view is created once and reflects later inventory changes without
+        copying the list on each access.
         """
-        return tuple(self.inventory)
+        return self._inventory_view
@@ -0,0 +1,308 @@
+"""
+spectator.py
+============
+Spectator broadcasting for *Echoes of Abyssus-9*.
+
+Live playthroughs are streamed to viewers as compact state deltas instead
+of re-rendered room text. Each game turn is encoded exactly once into a
+shared ring buffer; every subscriber reads the same encoded frames through
+its own cursor, so publishing costs the same for one viewer or many.
+
+Responsibilities:
+- Encode turn deltas (room change, item collected, outcome) once per turn
+- Fan frames out to any number of subscribers via a fixed-size ring buffer
+- Bound per-poll work for slow consumers, report consumers lagging past a
+  threshold so transports can throttle or drop them, and resynchronize
+  consumers that fall behind the ring with a catch-up snapshot
+
+This module contains no game loop logic or print statements.
+"""
+
+from __future__ import annotations
+
+import json
+
+__all__ = [
+    "SpectatorHub",
+    "Subscription",
+    "decode_frame",
+]
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_MAX_BATCH = 64
+DEFAULT_SLOW_LAG = DEFAULT_CAPACITY // 2
+
+DELTA_KIND = "d"
+SNAPSHOT_KIND = "s"
+
+# Cursor value for subscribers that have not yet received a snapshot.
+_NEEDS_SNAPSHOT = -1
+
+
+# ---------------------------------------------------------------------------
+# Frame Encoding
+# ---------------------------------------------------------------------------
+
+def _encode(frame: dict[str, object]) -> bytes:
+    """Encode a frame as compact UTF-8 JSON."""
+    return json.dumps(frame, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_frame(payload: bytes) -> dict[str, object]:
+    """
+    Decode a frame produced by SpectatorHub.
+
+    Frame keys:
+        - ``k``: ``"d"`` for a delta, ``"s"`` for a snapshot
+        - ``s``: sequence number of the frame
+        - ``r``: room entered (delta) or current room (snapshot)
+        - ``i``: item collected (delta only)
+        - ``inv``: full inventory (snapshot only)
+        - ``o``: final outcome, once known
+        - ``e``: present (``1``) once the session has ended
+
+    Args:
+        payload (bytes): Encoded frame.
+
+    Returns:
+        dict[str, object]: Decoded frame.
+    """
+    return json.loads(payload)
+
+
+# ---------------------------------------------------------------------------
+# Subscription
+# ---------------------------------------------------------------------------
+
+class Subscription:
+    """
+    A single viewer's read position in a SpectatorHub.
+
+    Tracks:
+        - The next sequence number to read
+        - How many catch-up snapshots the viewer has needed
+    """
+
+    __slots__ = ("cursor", "resyncs")
+
+    def __init__(self) -> None:
+        self.cursor: int = _NEEDS_SNAPSHOT
+        self.resyncs: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Spectator Hub
+# ---------------------------------------------------------------------------
+
+class SpectatorHub:
+    """
+    Broadcasts encoded turn deltas for one game session.
+
+    Publishing writes one encoded frame into a fixed-size ring buffer and
+    never waits on viewers. Viewers pull frames with ``poll``:
+
+    - at most ``max_batch`` frames are returned per poll, bounding the work
+      a slow consumer can demand in one call
+    - a viewer whose cursor has been overwritten by the ring receives a
+      single snapshot of the current state instead of the missed deltas
+    - viewers lagging by ``slow_lag`` frames or more are reported by
+      ``slow_subscribers`` so the transport can throttle or drop them
+
+    Snapshots are encoded at most once per published sequence number and
+    shared between every viewer that needs one.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        slow_lag: int | None = None,
+    ):
+        """
+        Initialize an empty hub.
+
+        Args:
+            capacity (int): Number of frames retained in the ring buffer.
+            max_batch (int): Maximum number of frames returned per poll.
+            slow_lag (int | None): Unread frames at which a viewer counts as
+                slow. Defaults to half of ``capacity``.
+
+        Raises:
+            ValueError: If ``capacity``, ``max_batch`` or ``slow_lag`` is
+                less than 1.
+        """
+        if slow_lag is None:
+            slow_lag = max(1, capacity // 2)
+        if capacity < 1 or max_batch < 1 or slow_lag < 1:
+            raise ValueError("'capacity', 'max_batch' and 'slow_lag' must be at least 1.")
+
+        self.capacity: int = capacity
+        self.max_batch: int = max_batch
+        self.slow_lag: int = slow_lag
+
+        self._subscriptions: set[Subscription] = set()
+
+        self._frames: list[bytes | None] = [None] * capacity
+        self._head: int = 0  # Sequence number of the next frame
+
+        # Cumulative state, used to build catch-up snapshots
+        self._room: str | None = None
+        self._inventory: list[str] = []
+        self._outcome: str | None = None
+        self._ended: bool = False
+
+        self._snapshot: bytes | None = None
+        self._snapshot_seq: int = -1
+
+    # ----------------------------------------------------------------------
+    # Publishing
+    # ----------------------------------------------------------------------
+
+    def publish(
+        self,
+        room: str | None = None,
+        item: str | None = None,
+        outcome: str | None = None,
+        ended: bool = False,
+    ) -> int:
+        """
+        Encode and publish one turn delta.
+
+        Args:
+            room (str | None): Room entered this turn, if the room changed.
+            item (str | None): Item collected this turn, if any.
+            outcome (str | None): Final outcome, if the game ended this turn.
+            ended (bool): True if the session ended this turn, whether by
+                reaching an outcome or by the player quitting.
+
+        Returns:
+            int: Sequence number assigned to the delta.
+        """
+        seq = self._head
+        frame: dict[str, object] = {"k": DELTA_KIND, "s": seq}
+
+        if room is not None:
+            self._room = room
+            frame["r"] = room
+        if item is not None:
+            self._inventory.append(item)
+            frame["i"] = item
+        if outcome is not None:
+            self._outcome = outcome
+            frame["o"] = outcome
+        if ended:
+            self._ended = True
+            frame["e"] = 1
+
+        self._frames[seq % self.capacity] = _encode(frame)
+        self._head = seq + 1
+
+        return seq
+
+    # ----------------------------------------------------------------------
+    # Subscribing
+    # ----------------------------------------------------------------------
+
+    def subscribe(self) -> Subscription:
+        """
+        Register a new viewer.
+
+        The first poll of a new subscription returns a snapshot of the
+        current state, after which deltas follow.
+        """
+        subscription = Subscription()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Forget a viewer, for example after its transport dropped it.
+        """
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of registered viewers."""
+        return len(self._subscriptions)
+
+    def lag(self, subscription: Subscription) -> int:
+        """
+        Return how many frames the viewer has not yet read.
+        """
+        if subscription.cursor == _NEEDS_SNAPSHOT:
+            return self._head
+        return self._head - subscription.cursor
+
+    def slow_subscribers(self) -> list[Subscription]:
+        """
+        Return the viewers lagging by at least ``slow_lag`` frames.
+
+        Publishing never waits on viewers, so this is the backpressure
+        signal: transports call it periodically and throttle, skip, or
+        ``unsubscribe`` the viewers it returns. Viewers that have not yet
+        received their initial snapshot are not reported.
+        """
+        head = self._head
+        threshold = self.slow_lag
+        return [
+            subscription
+            for subscription in self._subscriptions
+            if subscription.cursor != _NEEDS_SNAPSHOT
+            and head - subscription.cursor >= threshold
+        ]
+
+    def poll(self, subscription: Subscription) -> list[bytes]:
+        """
+        Return the next encoded frames for a viewer and advance its cursor.
+
+        Args:
+            subscription (Subscription): The viewer's subscription.
+
+        Returns:
+            list[bytes]: Up to ``max_batch`` delta frames, or a single
+            snapshot frame if the viewer is new or has fallen behind the ring.
+        """
+        cursor = subscription.cursor
+        head = self._head
+
+        if cursor == _NEEDS_SNAPSHOT or cursor < head - self.capacity:
+            if cursor != _NEEDS_SNAPSHOT:
+                subscription.resyncs += 1
+            subscription.cursor = head
+            return [self.snapshot()]
+
+        end = min(head, cursor + self.max_batch)
+        subscription.cursor = end
+
+        frames = self._frames
+        capacity = self.capacity
+        return [frames[seq % capacity] for seq in range(cursor, end)]
+
+    def snapshot(self) -> bytes:
+        """
+        Return an encoded snapshot of the session's current state.
+
+        The snapshot's sequence number is the next delta's sequence number,
+        so a viewer resumes cleanly from it.
+        """
+        if self._snapshot_seq != self._head:
+            frame: dict[str, object] = {
+                "k": SNAPSHOT_KIND,
+                "s": self._head,
+                "r": self._room,
+                "inv": self._inventory,
+            }
+            if self._outcome is not None:
+                frame["o"] = self._outcome
+            if self._ended:
+                frame["e"] = 1
+
+            self._snapshot = _encode(frame)
+            self._snapshot_seq = self._head
+
+        return self._snapshot
@@ -22,6 +22,8 @@ __all__ = [
     "print_move_failure",
     "print_room_description",
     "describe_exits",
+    "format_exits",
+    "format_room",
 ]
 
 
@@ -42,8 +44,11 @@ def normalize_direction(direction: str) -> str:
 
     Returns:
         str: Normalized lowercase direction string.
+
+    Already-normalized input is returned as-is without allocating a copy.
     """
-    return direction.strip().lower()
+    stripped = direction.strip()
+    return stripped if stripped.islower() else stripped.lower()
 
 
 # ---------------------------------------------------------------------------
@@ -86,19 +91,62 @@ def print_room_description(description: str) -> None:
         print(f"\n{description}\n")
 
 
-def describe_exits(exits: Mapping[str, str]) -> None:
+def format_exits(exits: Mapping[str, str]) -> str:
     """
-    Display the available exits from the current room.
+    Build the line describing the available exits from a room.
 
     Args:
         exits (dict[str, str]): Mapping of direction -> destination room.
+
+    Returns:
+        str: Exit description, or an empty string if the room has no exits.
     """
     if not exits:
-        return
+        return ""
 
     directions = sorted(exits)
 
     if len(directions) == 1:
-        print(f"A corridor leads {directions[0]}.")
-    else:
-        print(f"Corridors lead {', '.join(directions)}.")
+        return f"A corridor leads {directions[0]}."
+    return f"Corridors lead {', '.join(directions)}."
+
+
+def describe_exits(exits: Mapping[str, str]) -> None:
+    """
+    Display the available exits from the current room.
+
+    Args:
+        exits (dict[str, str]): Mapping of direction -> destination room.
+    """
+    exit_line = format_exits(exits)
+
+    if exit_line:
+        print(exit_line)
+
+
+def format_room(room: str, description: str, exits: Mapping[str, str]) -> str:
+    """
+    Build the full text shown when the player is in a room.
+
+    Produces the same output as printing the room header, then calling
+    ``print_room_description`` and ``describe_exits``, so it can be rendered
+    once per room and reused on every turn.
+
+    Args:
+        room (str): Room name.
+        description (str): Text describing the room.
+        exits (dict[str, str]): Mapping of direction -> destination room.
+
+    Returns:
+        str: Room text ready to be printed.
+    """
+    lines = [f"\nYou are in the {room}."]
+
+    if description:
+        lines.append(f"\n{description}\n")
+
+    exit_line = format_exits(exits)
+    if exit_line:
+        lines.append(exit_line)
+
+    return "\n".join(lines)
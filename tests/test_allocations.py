@@ -0,0 +1,231 @@
+"""
+Allocation checks for the per-turn hot path.
+
+tracemalloc reports the blocks still alive and the peak of traced memory,
+but not how many allocations a call made and freed again, so a true
+per-turn allocation count cannot be pinned portably. These tests pin
+instead:
+
+- growth: trace entries retained after 20 turns must not exceed those
+  retained after 1 turn, so nothing accumulates per turn
+- peak bytes: the transient footprint of a single turn above an empty
+  call, within a budget that includes ``PEAK_MARGIN`` for allocator
+  differences between Python versions
+- scaling: a turn must cost the same with a 10,000-item inventory or a
+  10,000-character input as with a small one, which catches per-turn
+  copies independently of the interpreter version
+
+Output goes to a real line-buffered ``io.TextIOWrapper`` over a raw stream
+that discards bytes, so ``print`` and encoding costs match a terminal.
+"""
+
+import contextlib
+import io
+import tracemalloc
+
+import pytest
+
+from src.events import handle_final_event
+from src.fuzzy import build_direction_index
+from src.game import REQUIRED_ITEM_IDS, handle_move
+from src.items import ROOM_ITEMS
+from src.player import Player
+from src.utils import normalize_direction
+from src.world import ROOM_CONNECTIONS
+
+# Headroom above the largest peak measured on CPython 3.8-3.13, covering
+# free-list and allocator differences between versions.
+PEAK_MARGIN = 256
+
+# Peak bytes per turn above the empty baseline: the largest value measured
+# on CPython 3.8-3.13, plus the margin. Most of it is the message string and
+# its encoded copy inside the TextIOWrapper.
+PEAK_BUDGETS = {
+    "move": 420 + PEAK_MARGIN,
+    "failed_move": 416 + PEAK_MARGIN,
+    "pickup": 448 + PEAK_MARGIN,  # Two messages and inventory list storage
+    "endgame": 336 + PEAK_MARGIN,  # Encounter and victory text
+    "normalize": 0 + PEAK_MARGIN,
+}
+
+# Largest peak difference allowed between a large and a small input. A
+# per-turn copy of 10,000 items or characters costs tens of kilobytes.
+SCALING_TOLERANCE = 512
+
+LARGE = 10_000
+
+_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+class _DiscardingRaw(io.RawIOBase):
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return len(data)
+
+
+def _line_buffered_sink():
+    return io.TextIOWrapper(
+        io.BufferedWriter(_DiscardingRaw()), encoding="utf-8", line_buffering=True
+    )
+
+
+def _measure(turn, setup=lambda: None, turns=1, warmup=3):
+    """Return (retained trace entries, peak bytes) for ``turns`` turns."""
+    # Redirection happens here: pytest swaps sys.stdout back between
+    # fixture setup and the test body.
+    with contextlib.redirect_stdout(_line_buffered_sink()):
+        for _ in range(warmup):
+            setup()
+            turn()
+        setup()
+
+        # Starting tracemalloc right before the turn resets the peak, which
+        # avoids tracemalloc.reset_peak() (Python 3.9+ only).
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            for _ in range(turns):
+                turn()
+                setup()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    retained = len(after.filter_traces(_FILTERS).traces)
+
+    return retained, peak - baseline
+
+
+@pytest.fixture
+def measure():
+    # Only the peak is taken relative to the empty call. Retained entries are
+    # compared between runs of the same scenario, and the empty call's
+    # one-off allocations would skew them.
+    _, empty_peak = _measure(lambda: None)
+
+    def run(turn, setup=lambda: None, turns=1):
+        retained, peak = _measure(turn, setup, turns)
+        return retained, peak - empty_peak
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+# Each returns (turn, setup); ``size`` is the number of inventory items
+# carried, or the padding added to the direction for ``_normalize``.
+
+def _filler_items(count):
+    return [f"crate_{number}" for number in range(count)]
+
+
+def _move(size=0):
+    index = build_direction_index(ROOM_CONNECTIONS)
+    player = Player(starting_room="Docking Bay")
+    player.inventory.extend(_filler_items(size))
+
+    def setup():
+        player.current_room = "Docking Bay"
+
+    def turn():
+        handle_move(player, "north", index)
+        assert player.current_room == "Main Hall"
+
+    return turn, setup
+
+
+def _failed_move(size=0):
+    index = build_direction_index(ROOM_CONNECTIONS)
+    player = Player(starting_room="Docking Bay")
+    player.inventory.extend(_filler_items(size))
+
+    def turn():
+        handle_move(player, "east", index)
+        assert player.current_room == "Docking Bay"
+
+    return turn, lambda: None
+
+
+def _pickup(size=0):
+    index = build_direction_index(ROOM_CONNECTIONS)
+    player = Player(starting_room="Main Hall")
+    player.inventory.extend(_filler_items(size))
+
+    def setup():
+        player.current_room = "Main Hall"
+        ROOM_ITEMS["Security Office"] = "override_alpha"
+        if player.inventory[-1:] == ["override_alpha"]:
+            player.inventory.pop()
+
+    def turn():
+        handle_move(player, "west", index)
+        assert player.inventory[-1] == "override_alpha"
+
+    return turn, setup
+
+
+def _endgame(size=0):
+    player = Player(starting_room="Control Center")
+    player.inventory.extend(_filler_items(size))
+    player.inventory.extend(REQUIRED_ITEM_IDS)
+
+    def turn():
+        assert handle_final_event(player, required_item_ids=REQUIRED_ITEM_IDS) == "SUCCESS"
+
+    return turn, lambda: None
+
+
+def _normalize(size=0):
+    direction = "north" + "-" * size
+
+    def turn():
+        normalize_direction(direction)
+
+    return turn, lambda: None
+
+
+SCENARIOS = {
+    "move": _move,
+    "failed_move": _failed_move,
+    "pickup": _pickup,
+    "endgame": _endgame,
+    "normalize": _normalize,
+}
+
+
+@pytest.fixture(autouse=True)
+def _restore_room_items(monkeypatch):
+    monkeypatch.setitem(ROOM_ITEMS, "Security Office", ROOM_ITEMS.get("Security Office"))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_turns_do_not_accumulate_memory(measure, name):
+    once, _ = measure(*SCENARIOS[name](), turns=1)
+    repeated, _ = measure(*SCENARIOS[name](), turns=20)
+
+    assert repeated <= once, f"{name}: {repeated} entries after 20 turns, {once} after 1"
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_peak_within_budget(measure, name):
+    _, peak = measure(*SCENARIOS[name]())
+
+    assert peak <= PEAK_BUDGETS[name], f"{name}: {peak} peak bytes (budget {PEAK_BUDGETS[name]})"
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_turn_cost_does_not_scale_with_input_size(measure, name):
+    _, small = measure(*SCENARIOS[name]())
+    _, large = measure(*SCENARIOS[name](LARGE))
+
+    assert large - small <= SCALING_TOLERANCE, (
+        f"{name}: {large} peak bytes with {LARGE} items, {small} without"
+    )
@@ -0,0 +1,65 @@
+import pytest
+
+from src.fuzzy import FuzzyIndex, build_command_index, build_direction_index, edit_distance
+
+
+CONNECTIONS = {
+    "Main Hall": {"north": "Deck", "south": "Bay", "east": "Lab", "west": "Office"},
+    "Bay": {"north": "Main Hall"},
+}
+
+
+def test_edit_distance_counts_transpositions():
+    assert edit_distance("nroth", "north") == 1
+    assert edit_distance("hlep", "help") == 1
+    assert edit_distance("north", "south") == 2
+
+
+def test_direction_index_resolves_typos():
+    index = build_direction_index(CONNECTIONS)
+
+    assert index.resolve("nroth") == "north"
+    assert index.resolve("est") == "east"
+    assert index.resolve("north") == "north"
+
+
+def test_direction_index_narrows_to_room_exits():
+    index = build_direction_index(CONNECTIONS)
+
+    assert index.resolve("est", candidates=CONNECTIONS["Bay"]) is None
+    assert index.resolve("south", candidates=CONNECTIONS["Bay"]) is None
+    assert index.resolve("nroth", candidates=CONNECTIONS["Bay"]) == "north"
+
+
+def test_known_word_is_never_corrected_to_another_candidate():
+    index = FuzzyIndex(["in", "on"])
+
+    assert index.resolve("in", candidates={"on"}) is None
+
+
+def test_command_index_resolves_typos():
+    index = build_command_index(["go", "help", "quit"])
+
+    assert index.resolve("hlep") == "help"
+    assert index.resolve("qiut") == "quit"
+    assert index.resolve("xyzzy") is None
+
+
+def test_short_words_are_only_matched_exactly():
+    index = build_command_index(["go", "help"])
+
+    assert index.resolve("go") == "go"
+    assert index.resolve("og") is None
+    assert index.resolve("no") is None
+    assert index.resolve("g") is None
+
+
+def test_ambiguous_input_is_not_guessed():
+    index = FuzzyIndex(["bats", "cats"])
+
+    assert index.resolve("ats") is None
+
+
+def test_negative_max_distance_rejected():
+    with pytest.raises(ValueError):
+        FuzzyIndex(["north"], max_distance=-1)
@@ -0,0 +1,38 @@
+import pytest
+
+from src.game import main
+
+
+@pytest.fixture
+def play(monkeypatch, capsys):
+    def run(*commands):
+        inputs = iter(commands)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        main()
+        return capsys.readouterr().out
+
+    return run
+
+
+@pytest.mark.parametrize("typo", ["qiut", "qit", "quiet"])
+def test_quit_is_never_inferred_from_a_typo(play, typo):
+    output = play(typo, "quit")
+
+    assert "Invalid command" in output
+    assert output.count("Mission aborted") == 1
+
+
+@pytest.mark.parametrize("verb", ["no", "to", "so"])
+def test_go_is_never_inferred_from_a_different_first_letter(play, verb):
+    output = play(f"{verb} north", "quit")
+
+    assert "Invalid command" in output
+    assert "You move" not in output
+    assert "Interpreting" not in output
+
+
+def test_verb_corrections_are_announced(play):
+    output = play("hlep", "quit")
+
+    assert "(Interpreting 'hlep' as 'help'.)" in output
+    assert "Commands:" in output
@@ -0,0 +1,125 @@
+import pytest
+
+from src.fuzzy import build_direction_index
+from src.game import handle_move, main
+from src.player import Player
+from src.spectator import SpectatorHub, decode_frame
+from src.world import ROOM_CONNECTIONS
+
+
+def test_new_subscriber_receives_snapshot_first():
+    hub = SpectatorHub()
+    hub.publish(room="Docking Bay")
+    hub.publish(room="Main Hall")
+
+    subscription = hub.subscribe()
+    frames = [decode_frame(frame) for frame in hub.poll(subscription)]
+
+    assert frames == [{"k": "s", "s": 2, "r": "Main Hall", "inv": []}]
+    assert hub.poll(subscription) == []
+
+
+def test_deltas_are_shared_between_subscribers():
+    hub = SpectatorHub()
+    first, second = hub.subscribe(), hub.subscribe()
+    hub.poll(first)
+    hub.poll(second)
+
+    hub.publish(room="Security Office", item="override_alpha")
+
+    first_frames = hub.poll(first)
+    second_frames = hub.poll(second)
+
+    assert first_frames[0] is second_frames[0]
+    assert decode_frame(first_frames[0]) == {
+        "k": "d", "s": 0, "r": "Security Office", "i": "override_alpha",
+    }
+
+
+def test_poll_is_bounded_by_max_batch():
+    hub = SpectatorHub(capacity=16, max_batch=2)
+    subscription = hub.subscribe()
+    hub.poll(subscription)
+
+    for _ in range(5):
+        hub.publish(room="Main Hall")
+
+    assert len(hub.poll(subscription)) == 2
+    assert hub.lag(subscription) == 3
+
+
+def test_lagging_subscriber_catches_up_with_snapshot():
+    hub = SpectatorHub(capacity=4)
+    subscription = hub.subscribe()
+    hub.poll(subscription)
+
+    for room in ["Main Hall", "Engineering Bay", "Main Hall", "Security Office", "Main Hall"]:
+        hub.publish(room=room)
+    hub.publish(item="override_alpha")
+    hub.publish(outcome="FAILURE")
+
+    frames = [decode_frame(frame) for frame in hub.poll(subscription)]
+
+    assert frames == [{
+        "k": "s", "s": 7, "r": "Main Hall", "inv": ["override_alpha"], "o": "FAILURE",
+    }]
+    assert subscription.resyncs == 1
+    assert hub.lag(subscription) == 0
+
+
+def test_slow_subscribers_are_reported_until_they_catch_up():
+    hub = SpectatorHub(capacity=16, max_batch=2, slow_lag=3)
+    fast, slow = hub.subscribe(), hub.subscribe()
+    hub.poll(fast)
+    hub.poll(slow)
+
+    for _ in range(4):
+        hub.publish(room="Main Hall")
+        hub.poll(fast)
+
+    assert hub.slow_subscribers() == [slow]
+
+    hub.poll(slow)
+    hub.poll(slow)
+
+    assert hub.slow_subscribers() == []
+
+
+def test_unsubscribed_viewers_are_forgotten():
+    hub = SpectatorHub(slow_lag=1)
+    subscription = hub.subscribe()
+    hub.poll(subscription)
+    hub.publish(room="Main Hall")
+
+    hub.unsubscribe(subscription)
+
+    assert hub.subscriber_count == 0
+    assert hub.slow_subscribers() == []
+
+
+def test_handle_move_publishes_room_delta():
+    hub = SpectatorHub()
+    subscription = hub.subscribe()
+    hub.poll(subscription)
+    player = Player(starting_room="Docking Bay")
+
+    handle_move(player, "north", build_direction_index(ROOM_CONNECTIONS), hub)
+
+    frames = [decode_frame(frame) for frame in hub.poll(subscription)]
+    assert frames == [{"k": "d", "s": 0, "r": "Main Hall"}]
+
+
+def test_quitting_publishes_end_of_session(monkeypatch, capsys):
+    hub = SpectatorHub()
+    subscription = hub.subscribe()
+    monkeypatch.setattr("builtins.input", lambda prompt="": "quit")
+
+    main(spectators=hub)
+
+    frames = [decode_frame(frame) for frame in hub.poll(subscription)]
+    assert frames == [{"k": "s", "s": 2, "r": "Docking Bay", "inv": [], "e": 1}]
+
+
+def test_invalid_capacity_rejected():
+    with pytest.raises(ValueError):
+        SpectatorHub(capacity=0)
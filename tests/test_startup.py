@@ -0,0 +1,78 @@
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from src.launcher import play_connection
+
+
+def test_importing_game_defers_lazy_subsystems():
+    lazy_modules = ["typing", "src.fuzzy", "src.spectator"]
+    script = (
+        "import sys, src.game; "
+        f"print([name for name in {lazy_modules!r} if name in sys.modules])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-S", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="'X | None' annotations need Python 3.10+ to evaluate"
+)
+def test_outcome_annotation_resolves_before_first_access():
+    # A fresh interpreter, so Outcome has not been cached by another test.
+    script = (
+        "import typing, src.events; "
+        "print(typing.get_type_hints(src.events.handle_final_event)['return'])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "typing.Literal['SUCCESS', 'FAILURE']"
+
+
+def test_world_tables_are_rebuilt_per_game(monkeypatch, capsys):
+    from src import game, world
+
+    room = dict(world.ROOM_CONNECTIONS["Docking Bay"], up="Main Hall")
+    monkeypatch.setitem(world.ROOM_CONNECTIONS, "Docking Bay", room)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "quit")
+
+    game.main()
+
+    assert "Corridors lead north, up." in capsys.readouterr().out
+
+
+def test_play_connection_runs_game_over_socket():
+    server, client = socket.socketpair()
+    client.sendall(b"go north\nquit\n")
+
+    thread = threading.Thread(target=play_connection, args=(server,))
+    thread.start()
+    thread.join(timeout=5)
+    server.close()
+
+    if thread.is_alive():
+        pytest.fail("play_connection did not finish; sys.stdin/sys.stdout are still swapped")
+
+    output = b""
+    while chunk := client.recv(65536):
+        output += chunk
+    client.close()
+
+    assert b"You move north into the Main Hall." in output
+    assert output.endswith(b"Mission aborted. Exiting Abyssus-9.\n")